@@ -1,4 +1,6 @@
+from functools import lru_cache
 from inspect import Parameter, Signature
+from typing import FrozenSet
 
 from mne_bids import BIDSPath  # type: ignore
 
@@ -61,8 +63,9 @@ class BIDSPathTemplate(FrozenBIDSPath):
         # based on recipie 9.16 from the Python Cookbook, 3-d edition
         self._fpath_sig.bind(**kwargs)
 
-        concrete_bp = self.update(**kwargs, check=self._check)
-        return super(self.__class__, concrete_bp).__getattr__("fpath")
+        # fill in the template on a bare BIDSPath copy: going through
+        # update() would also build a throwaway template wrapper
+        return self._bp.copy().update(**kwargs).fpath
 
     def update(self, *, check: bool = None, **kwargs):
         """
@@ -92,10 +95,7 @@ class BIDSPathTemplate(FrozenBIDSPath):
         return self._template_vars
 
     def _make_fpath_signature(self):
-        params = [
-            Parameter(p, Parameter.KEYWORD_ONLY) for p in self._template_vars
-        ]
-        self._fpath_sig = Signature(params)
+        self._fpath_sig = _fpath_signature(frozenset(self._template_vars))
 
     def _check_template_var(self, var):
         if var not in self.entities:
@@ -108,3 +108,10 @@ class BIDSPathTemplate(FrozenBIDSPath):
                 "Can only set 'None' entities as the template ones"
                 f" ({var} is set to '{self.entities[var]}')"
             )
+
+
+@lru_cache(maxsize=256)
+def _fpath_signature(template_vars: FrozenSet[str]) -> Signature:
+    """Keyword-only signature for fpath(); shared between equal var sets"""
+    params = [Parameter(p, Parameter.KEYWORD_ONLY) for p in template_vars]
+    return Signature(params)
@@ -1,6 +1,6 @@
 from dataclasses import dataclass
 from os import PathLike
-from typing import Optional
+from typing import Optional, Union
 
 import mne  # type: ignore
 from mne import Report  # type: ignore
@@ -12,7 +12,8 @@ from metapipe.abc import MneContainer, Reader, Writer
 
 @dataclass
 class RawFifReader(Reader):
-    preload: bool = True
+    """Read raw fif file; samples stay on disk unless preload is set"""
+    preload: Union[bool, str] = False
 
     def run(self, path: PathLike) -> mne.io.Raw:
         return read_raw_fif(path, preload=self.preload)
@@ -20,16 +21,46 @@ class RawFifReader(Reader):
 
 @dataclass
 class BrainvisionReader(Reader):
-    preload: bool = True
+    """Read Brainvision file; samples stay on disk unless preload is set"""
+    preload: Union[bool, str] = False
 
     def run(self, path: PathLike) -> mne.io.Raw:
         return read_raw_brainvision(path, preload=self.preload)
 
 
+@dataclass
 class MneWriter(Writer):
-    """Write mne container"""
+    """
+    Write mne container
+
+    Parameters
+    ----------
+    fmt : str, default="single"
+        Precision of the saved samples; "single" halves file size compared
+        to "double"
+    split_size : str | int, default="2GB"
+        Maximum size of a single file; larger data is split into parts
+    overwrite : bool, default=False
+        Overwrite existing file; if False, saving to an existing path raises
+
+    See also
+    --------
+    mne.io.BaseRaw.save
+    mne.Epochs.save
+
+    """
+
+    fmt: str = "single"
+    split_size: Union[str, int] = "2GB"
+    overwrite: bool = False
+
     def run(self, savepath: PathLike, raw: MneContainer) -> None:
-        raw.save(savepath)
+        raw.save(
+            savepath,
+            fmt=self.fmt,
+            split_size=self.split_size,
+            overwrite=self.overwrite,
+        )
 
 
 class MneBidsWriter(Writer):
@@ -11,7 +11,7 @@ from metapipe.abc import MneContainer, Processor
 @dataclass
 class Filter:
     """
-    FIR filter class for raw data
+    FIR or IIR filter class for raw data
 
     Parameters
     ----------
@@ -19,6 +19,16 @@ class Filter:
         Lower band-pass filter edge; if None, lowpass the data
     h_freq : float | None
         Higher band-pass filter edge; if None, highpass the data
+    method : str, default="fir"
+        "fir" for zero-phase FIR filtering, "iir" for forward-backward IIR
+        filtering, which is considerably cheaper for low l_freq
+    iir_params : dict | None, default=None
+        IIR filter design, e.g. dict(order=4, ftype="ellip", rp=1, rs=60);
+        None designs a 4-th order Butterworth filter. Used only when
+        method="iir"
+    n_jobs : int | str, default=1
+        Number of channels filtered in parallel; "cuda" filters on GPU
+        (requires cupy and mne.cuda.init_cuda())
 
     Notes
     -----
@@ -32,6 +42,9 @@ class Filter:
 
     l_freq: Optional[float]
     h_freq: Optional[float]
+    method: str = "fir"
+    iir_params: Optional[dict] = None
+    n_jobs: Union[int, str] = 1
 
     def run(self, x: MneContainer) -> MneContainer:
         """
@@ -48,7 +61,8 @@ class Filter:
 
         Warnings
         --------
-        Filter is also applied to the passed data
+        Filter is also applied to the passed data; data which is not
+        preloaded is loaded into memory first
 
         See also
         --------
@@ -57,7 +71,13 @@ class Filter:
 
         """
 
-        return x.filter(l_freq=self.l_freq, h_freq=self.h_freq)
+        return x.load_data().filter(
+            l_freq=self.l_freq,
+            h_freq=self.h_freq,
+            method=self.method,
+            iir_params=self.iir_params,
+            n_jobs=self.n_jobs,
+        )
 
 
 @dataclass
@@ -69,6 +89,9 @@ class Resampler:
     ----------
     sfreq : float
         Resample to this frequency
+    n_jobs : int | str, default=1
+        Number of channels resampled in parallel; "cuda" resamples on GPU
+        (requires cupy and mne.cuda.init_cuda())
 
     See also
     --------
@@ -78,6 +101,7 @@ class Resampler:
     """
 
     sfreq: float
+    n_jobs: Union[int, str] = 1
 
     def run(self, x: MneContainer) -> MneContainer:
         """
@@ -91,8 +115,13 @@ class Resampler:
         -------
         mne.io.BaseRaw | mne.Epochs
             Resampled data
+
+        Warnings
+        --------
+        Data which is not preloaded is loaded into memory first
+
         """
-        return x.resample(self.sfreq)
+        return x.load_data().resample(self.sfreq, n_jobs=self.n_jobs)
 
 
 @dataclass
@@ -116,6 +145,10 @@ class IcaComputer:
         Which channels to use for ICA; "data" picks only data channels
         (no ecg, eog, etc.), "all" or None picks all channels. More flexible
         setup is available, see docs for mne.preprocessing.ICA.fit()
+    method: str, default="picard"
+        ICA algorithm; picard converges considerably faster than "fastica"
+        on EEG/MEG data; set to "fastica" to reproduce solutions computed
+        before picard became the default
 
 
     See also
@@ -131,6 +164,7 @@ class IcaComputer:
     decim: Optional[int] = None
     reject_by_annotation: bool = True
     picks: Optional[Union[str, list, slice]] = "data"
+    method: str = "picard"
 
     def run(self, x: MneContainer) -> mne.preprocessing.ICA:
         """
@@ -151,6 +185,7 @@ class IcaComputer:
             n_components=self.n_components,
             max_iter=self.max_iter,
             random_state=self.random_state,
+            method=self.method,
         )
         ica.fit(
             x,
@@ -208,10 +243,27 @@ def set_annotations(annots: PathLike, raw: mne.io.BaseRaw) -> mne.io.BaseRaw:
 
 
 def concatenate_raws(*raws: mne.io.BaseRaw) -> mne.io.BaseRaw:
-    """Concatenate common channels from raw objects"""
+    """
+    Concatenate common channels from raw objects
+
+    Common channels keep their order in the first raw; raws already holding
+    exactly these channels in this order are not re-picked
+
+    """
     if len(raws) == 1:
         return raws[0]
-    common_ch_names = set.intersection(*[set(r.ch_names) for r in raws])
-    raws_sel = [raw.pick_channels(list(common_ch_names)) for raw in raws]
-    # assert False
+    if all(r.ch_names == raws[0].ch_names for r in raws[1:]):
+        return mne.concatenate_raws(list(raws))
+    common = set(raws[0].ch_names)
+    for raw in raws[1:]:
+        common.intersection_update(raw.ch_names)
+        if not common:
+            raise ValueError("Raw objects have no channels in common")
+    common_ch_names = [ch for ch in raws[0].ch_names if ch in common]
+    raws_sel = [
+        raw
+        if raw.ch_names == common_ch_names
+        else raw.pick_channels(common_ch_names, ordered=True)
+        for raw in raws
+    ]
     return mne.concatenate_raws(raws_sel)
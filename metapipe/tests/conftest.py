@@ -0,0 +1,68 @@
+from functools import lru_cache
+
+import mne  # type: ignore
+import numpy as np  # type: ignore
+from mne.channels import make_standard_montage  # type: ignore
+from mne.preprocessing import ICA  # type: ignore
+from pytest import fixture  # type: ignore
+
+
+@lru_cache(maxsize=8)
+def _standard_montage(montage_type):
+    return make_standard_montage(montage_type)
+
+
+@lru_cache(maxsize=8)
+def _eeg_info(montage_type, sfreq):
+    ch_names = _standard_montage(montage_type).ch_names
+    return mne.create_info(ch_names, ch_types="eeg", sfreq=sfreq)
+
+
+@lru_cache(maxsize=None)
+def _random_data(n_channels, n_times):
+    """Same data for the same shape, whatever tests ran before"""
+    return np.random.default_rng(42).random((n_channels, n_times))
+
+
+@fixture(scope="session")
+def simple_raw_factory():
+    def wrapped(T_seconds, sfreq, montage_type="biosemi32"):
+        n_times = int(T_seconds * sfreq)
+        # cached montage, info and data are shared: hand out copies only
+        montage = _standard_montage(montage_type).copy()
+        info = _eeg_info(montage_type, sfreq).copy()
+        data = _random_data(info["nchan"], n_times).copy()
+
+        raw = mne.io.RawArray(data, info)
+        raw.set_montage(montage)
+
+        return raw
+
+    return wrapped
+
+
+@fixture(scope="session")
+def saved_fif_fpath_and_object(simple_raw_factory, tmp_path_factory):
+    """Fif file written once per session; tests must only read it"""
+    savepath = tmp_path_factory.mktemp("fif") / "raw.fif"
+    raw = simple_raw_factory(1, 300)
+    raw.save(savepath)
+    return savepath, raw
+
+
+@fixture
+def tmp_raw_savepath(tmp_path):
+    dest_path = tmp_path / "raw.fif"
+    yield dest_path
+    if dest_path.exists():
+        dest_path.unlink()
+
+
+@fixture(scope="session")
+def ica(simple_raw_factory):
+    """ICA fitted once per session; tests must not modify it"""
+    raw = simple_raw_factory(4, 300)
+    raw.filter(l_freq=1, h_freq=None)
+    ica = ICA(max_iter=100, method="picard")
+    ica.fit(raw)
+    return ica
@@ -0,0 +1,42 @@
+from mne_bids import BIDSPath  # type: ignore
+from pytest import fixture, raises  # type: ignore
+
+from metapipe.bp_template import BIDSPathTemplate
+
+
+@fixture
+def bids_kwargs(tmp_path):
+    return dict(
+        root=tmp_path,
+        task="rest",
+        datatype="meg",
+        suffix="meg",
+        extension=".fif",
+    )
+
+
+@fixture
+def template(bids_kwargs):
+    return BIDSPathTemplate(template_vars=["subject"], **bids_kwargs)
+
+
+def test_fpath_matches_bids_path(template, bids_kwargs):
+    expected = BIDSPath(subject="01", check=False, **bids_kwargs).fpath
+    assert template.fpath(subject="01") == expected
+
+
+def test_fpath_without_template_var_raises(template):
+    with raises(TypeError):
+        template.fpath()
+
+
+def test_fpath_with_unexpected_var_raises(template):
+    with raises(TypeError):
+        template.fpath(subject="01", session="01")
+
+
+def test_fpath_keeps_template_entities(template):
+    entities = dict(template.entities)
+    template.fpath(subject="01")
+    assert template.entities == entities
+    assert template.subject is None
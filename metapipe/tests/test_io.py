@@ -1,25 +1,26 @@
 from mne import Report  # type: ignore
 from mne.io import read_raw_fif  # type: ignore
 from mne.preprocessing import ICA  # type: ignore
-from numpy.testing import assert_allclose  # type: ignore
-from pytest import fixture, mark  # type: ignore
+from numpy.testing import assert_allclose, assert_array_equal  # type: ignore
+from pytest import fixture, mark, raises  # type: ignore
 
 from metapipe import io
-from metapipe.tests.test_processors import ica  # type: ignore # noqa
-from metapipe.tests.test_processors import saved_fif_fpath_and_object  # noqa
-from metapipe.tests.test_processors import simple_raw_factory  # noqa
-from metapipe.tests.test_processors import \
-    tmp_raw_savepath  # type: ignore # noqa
 
 
-def test_fif_reader_reads_same_data(saved_fif_fpath_and_object):  # noqa
+def test_fif_reader_reads_same_data(saved_fif_fpath_and_object):
     reader = io.RawFifReader()
     loaded = reader.run(saved_fif_fpath_and_object[0])
     saved_raw = saved_fif_fpath_and_object[1]
     assert_allclose(loaded.get_data(), saved_raw.get_data())
 
 
-def test_mne_writer_data_unchanged(simple_raw_factory, tmp_raw_savepath):  # noqa
+def test_fif_reader_is_lazy_by_default(saved_fif_fpath_and_object):
+    reader = io.RawFifReader()
+    loaded = reader.run(saved_fif_fpath_and_object[0])
+    assert not loaded.preload
+
+
+def test_mne_writer_data_unchanged(simple_raw_factory, tmp_raw_savepath):
     raw = simple_raw_factory(1, 300)
     writer = io.MneWriter()
     writer.run(tmp_raw_savepath, raw)
@@ -27,8 +28,27 @@ def test_mne_writer_data_unchanged(simple_raw_factory, tmp_raw_savepath):  # noq
     assert_allclose(raw.get_data(), loaded_raw.get_data())
 
 
+def test_mne_writer_double_precision_is_exact(
+    simple_raw_factory, tmp_raw_savepath
+):
+    raw = simple_raw_factory(1, 300)
+    writer = io.MneWriter(fmt="double")
+    writer.run(tmp_raw_savepath, raw)
+    loaded_raw = read_raw_fif(tmp_raw_savepath)
+    assert_array_equal(raw.get_data(), loaded_raw.get_data())
+
+
+def test_mne_writer_without_overwrite_raises_on_existing_file(
+    simple_raw_factory, tmp_raw_savepath
+):
+    raw = simple_raw_factory(1, 300)
+    io.MneWriter().run(tmp_raw_savepath, raw)
+    with raises(OSError):
+        io.MneWriter(overwrite=False).run(tmp_raw_savepath, raw)
+
+
 @fixture
-def ica_path(tmp_path, ica):  # noqa
+def ica_path(tmp_path, ica):
     savepath = tmp_path / "test_ica.fif"
     ica.save(savepath)
     yield savepath
@@ -43,7 +63,7 @@ def test_ica_reader_returns_ICA_obj(ica_path):
     assert isinstance(ica_sol, ICA)
 
 
-def test_ica_writer(ica, tmp_path):  # noqa
+def test_ica_writer(ica, tmp_path):
     savepath = tmp_path / "writer_test_ica.fif"
     node = io.IcaWriter()
     node.run(savepath, ica)
@@ -1,58 +1,37 @@
-import mne  # type: ignore
-import numpy as np  # type: ignore
 from mne import Annotations, read_annotations  # type: ignore
-from mne.channels import make_standard_montage  # type: ignore
-from mne.preprocessing import ICA  # type: ignore
+from mne.io import read_raw_fif  # type: ignore
 from numpy.testing import assert_allclose  # type: ignore
-from pytest import fixture, mark  # type: ignore
+from pytest import fixture, mark, raises  # type: ignore
 
 from metapipe.processors import (Filter, IcaComputer, IcaReportMaker,
                                  Resampler, concatenate_raws, set_annotations)
 
 
-@fixture
-def simple_raw_factory():
-    def wrapped(T_seconds, sfreq, montage_type="biosemi32"):
-        ch_type = "eeg"
-        n_times = int(T_seconds * sfreq)
-        montage = make_standard_montage(montage_type)
-        ch_names = montage.ch_names
-        n_channels = len(ch_names)
-
-        data = np.random.rand(n_channels, n_times)
-        info = mne.create_info(ch_names, ch_types=ch_type, sfreq=sfreq)
-        raw = mne.io.RawArray(data, info)
-        raw.set_montage(montage)
-
-        return raw
-
-    return wrapped
-
-
-@fixture
-def saved_fif_fpath_and_object(simple_raw_factory, tmp_raw_savepath):
+def test_band_pass_filter_filters_data(simple_raw_factory):
     raw = simple_raw_factory(4, 300)
-    raw.save(tmp_raw_savepath)
-    return tmp_raw_savepath, raw
-
-
-@fixture
-def tmp_raw_savepath(tmp_path):
-    dest_path = tmp_path / "raw.fif"
-    yield dest_path
-    if dest_path.exists():
-        dest_path.unlink()
+    lf, hf = 1, 50
+    filt = Filter(l_freq=lf, h_freq=hf)
+    raw_filt = filt.run(raw)
+    assert raw_filt.info["highpass"] == lf
+    assert raw_filt.info["lowpass"] == hf
 
 
-def test_band_pass_filter_filters_data(simple_raw_factory):
+def test_iir_filter_filters_data(simple_raw_factory):
     raw = simple_raw_factory(4, 300)
     lf, hf = 1, 50
-    filt = Filter(l_freq=lf, h_freq=hf)
+    filt = Filter(l_freq=lf, h_freq=hf, method="iir")
     raw_filt = filt.run(raw)
     assert raw_filt.info["highpass"] == lf
     assert raw_filt.info["lowpass"] == hf
 
 
+def test_filter_loads_lazy_raw(saved_fif_fpath_and_object):
+    raw = read_raw_fif(saved_fif_fpath_and_object[0], preload=False)
+    raw_filt = Filter(l_freq=None, h_freq=50).run(raw)
+    assert raw_filt.preload
+    assert raw_filt.info["lowpass"] == 50
+
+
 def test_concat_with_same_channels(simple_raw_factory):
     raw = simple_raw_factory(1, 300)
     orig = raw.copy()
@@ -76,6 +55,22 @@ def test_cat_with_different_channels_intersects_channels(simple_raw_factory):
     assert set(raw_cat.ch_names) == set(raw2.ch_names)
 
 
+def test_cat_keeps_channel_order_of_first_raw(simple_raw_factory):
+    raw1 = simple_raw_factory(1, 300, "biosemi16")
+    raw2 = simple_raw_factory(1, 300, "biosemi32")
+    raw2.reorder_channels(raw2.ch_names[::-1])
+    raw_cat = concatenate_raws(raw1.copy(), raw2)
+    assert raw_cat.ch_names == raw1.ch_names
+
+
+def test_cat_without_common_channels_raises(simple_raw_factory):
+    raw1 = simple_raw_factory(1, 300, "biosemi16")
+    raw2 = simple_raw_factory(1, 300, "biosemi16")
+    raw2.rename_channels(lambda ch: ch + "-other")
+    with raises(ValueError):
+        concatenate_raws(raw1, raw2)
+
+
 def test_resample(simple_raw_factory):
     raw = simple_raw_factory(1, 300)
     resamp = Resampler(sfreq=150)
@@ -92,15 +87,6 @@ def test_ica_computer_fits_ica(simple_raw_factory):  # noqa
     assert hasattr(ica, "n_components_")
 
 
-@fixture
-def ica(simple_raw_factory):
-    raw = simple_raw_factory(4, 300)
-    raw.filter(l_freq=1, h_freq=None)
-    ica = ICA(max_iter=100, method="picard")
-    ica.fit(raw)
-    return ica
-
-
 @mark.slow
 def test_ica_report_maker(ica):
     node = IcaReportMaker()
@@ -125,3 +111,13 @@ def test_annot_setter(annot_path, simple_raw_factory):
     result = set_annotations(annot_path, raw)
     annots = read_annotations(annot_path)
     assert result.annotations == annots
+
+
+def test_annot_setter_reads_rewritten_file(annot_path, simple_raw_factory):
+    set_annotations(annot_path, simple_raw_factory(1, 100))
+    new_annot = Annotations(onset=[0.1], duration=[0.3], description=["new"])
+    annot_path.unlink()
+    new_annot.save(annot_path)
+    result = set_annotations(annot_path, simple_raw_factory(1, 100))
+    assert list(result.annotations.description) == ["new"]
+